@@ -4,19 +4,22 @@ def sum_position(char):
 def position_to_char(position):
     return chr((position - 1) % 26 + ord('a'))
 
-def decode_system_1(text):
-    decoded_text = ''
-    for char in text:
+class CharTable(dict):
+    def __init__(self, shift):
+        super().__init__()
+        self.shift = shift
+
+    def __missing__(self, code):
+        char = chr(code)
         if char.isalpha():
-            position = sum_position(char)
-            new_position = (position - 3) % 26
-            if new_position <= 0:
-                new_position += 26
-            new_char = position_to_char(new_position)
-            decoded_text += new_char
-        else:
-            decoded_text += char
-    return decoded_text
+            char = position_to_char(self.shift(sum_position(char)))
+        self[code] = char
+        return char
+
+DECODE_1_TABLE = CharTable(lambda position: position - 3)
+
+def decode_system_1(text):
+    return text.translate(DECODE_1_TABLE)
 
 def main_menu():
     while True:
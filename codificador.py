@@ -4,63 +4,35 @@ def sum_position(char):
 def position_to_char(position):
     return chr((position - 1) % 26 + ord('a'))
 
-def encode_system_1(text):
-    encoded_text = ''
-    for char in text:
+class CharTable(dict):
+    def __init__(self, shift):
+        super().__init__()
+        self.shift = shift
+
+    def __missing__(self, code):
+        char = chr(code)
         if char.isalpha():
-            position = sum_position(char)
-            new_position = (position + 3) % 26
-            if new_position == 0:
-                new_position = 26
-            new_char = position_to_char(new_position)
-            encoded_text += new_char
-        else:
-            encoded_text += char
-    return encoded_text
+            char = position_to_char(self.shift(sum_position(char)))
+        self[code] = char
+        return char
+
+ENCODE_1_TABLE = CharTable(lambda position: position + 3)
+DECODE_1_TABLE = CharTable(lambda position: position - 3)
+ENCODE_2_TABLE = CharTable(lambda position: position * 2)
+# Find the modular inverse of 2 mod 26, which is 13 (because 2 * 13 ≡ 1 mod 26)
+DECODE_2_TABLE = CharTable(lambda position: position * 13)
+
+def encode_system_1(text):
+    return text.translate(ENCODE_1_TABLE)
 
 def decode_system_1(text):
-    decoded_text = ''
-    for char in text:
-        if char.isalpha():
-            position = sum_position(char)
-            new_position = (position - 3) % 26
-            if new_position <= 0:
-                new_position += 26
-            new_char = position_to_char(new_position)
-            decoded_text += new_char
-        else:
-            decoded_text += char
-    return decoded_text
+    return text.translate(DECODE_1_TABLE)
 
 def encode_system_2(text):
-    encoded_text = ''
-    for char in text:
-        if char.isalpha():
-            position = sum_position(char)
-            new_position = (position * 2) % 26
-            if new_position == 0:
-                new_position = 26
-            new_char = position_to_char(new_position)
-            encoded_text += new_char
-        else:
-            encoded_text += char
-    return encoded_text
+    return text.translate(ENCODE_2_TABLE)
 
 def decode_system_2(text):
-    decoded_text = ''
-    for char in text:
-        if char.isalpha():
-            position = sum_position(char)
-            # Find the modular inverse of 2 mod 26, which is 13 (because 2 * 13 ≡ 1 mod 26)
-            inv = 13
-            new_position = (position * inv) % 26
-            if new_position == 0:
-                new_position = 26
-            new_char = position_to_char(new_position)
-            decoded_text += new_char
-        else:
-            decoded_text += char
-    return decoded_text
+    return text.translate(DECODE_2_TABLE)
 
 def main_menu():
     while True: